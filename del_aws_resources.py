@@ -1,7 +1,262 @@
 # delete_cloudformation.py
+"""
+Deletes AWS resources in one or more regions.
+
+All progress is reported through the logging module. When calling the delete_all_* functions
+from other code, configure logging first, for example:
+
+    logging.basicConfig(level=logging.INFO, format=del_aws_resources.LOG_FORMAT)
+"""
 
 import boto3
+import functools
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import sys
 import time
+from botocore.config import Config
+from collections import defaultdict
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
+from typing import Any, Optional, Tuple
+
+# Progress is logged at INFO level. Running the script sets up the handlers; callers that
+# import this module and call the delete_all_* functions directly must configure logging
+# themselves, e.g. logging.basicConfig(level=logging.INFO, format=LOG_FORMAT), or only
+# warnings will be shown.
+logger = logging.getLogger(__name__)
+LOG_FORMAT = '%(asctime)s %(levelname)s %(message)s'
+
+# Maximum number of concurrent delete requests issued per resource type
+MAX_WORKERS = 10
+
+# Number of threads waiting for deletions to complete in a listing/deletion/waiting pipeline
+PIPELINE_WAITERS = 20
+
+# Stack statuses eligible for deletion; 'AppPipe' and 'AppIngestion' stacks are also retried
+# after a failed deletion
+STACK_STATUSES = ('CREATE_COMPLETE', 'UPDATE_COMPLETE', 'ROLLBACK_COMPLETE')
+PRIORITY_STACK_STATUSES = STACK_STATUSES + ('DELETE_FAILED',)
+
+# Stack deletions are tracked by listing DELETE_IN_PROGRESS stacks every STACK_DRAIN_INTERVAL
+# seconds, for at most STACK_DELETE_TIMEOUT seconds
+STACK_DRAIN_INTERVAL = 15
+STACK_DELETE_TIMEOUT = 3600
+
+# Lambda deletions are quick, so they are issued with more concurrency, and verifying that
+# they are gone is given up after LAMBDA_VERIFY_TIMEOUT seconds
+LAMBDA_MAX_WORKERS = 20
+LAMBDA_VERIFY_TIMEOUT = 30
+
+# OpenSearch deletions are tracked by listing the domains every OPENSEARCH_DRAIN_INTERVAL
+# seconds, for at most OPENSEARCH_DELETE_TIMEOUT seconds
+OPENSEARCH_DRAIN_INTERVAL = 30
+OPENSEARCH_DELETE_TIMEOUT = 3600
+
+# Maximum number of EKS clusters torn down at once; each of them waits for up to MAX_WORKERS
+# node groups in parallel
+EKS_MAX_CLUSTERS = 4
+
+# Maximum number of instance IDs passed to a single TerminateInstances call
+EC2_BATCH_SIZE = 200
+
+# Maximum number of services and tasks accepted by the ECS DescribeServices and DescribeTasks calls
+# that back the services_inactive and tasks_stopped waiters
+ECS_SERVICE_BATCH_SIZE = 10
+ECS_TASK_BATCH_SIZE = 100
+
+# Adaptive retries smooth out API throttling instead of failing hard. The connection pool is
+# sized above the largest number of threads sharing a client, which is the EC2 pipeline
+# (1 + MAX_WORKERS + PIPELINE_WAITERS) or the EKS teardown (EKS_MAX_CLUSTERS cluster workers
+# plus MAX_WORKERS node group waiters each), so concurrent requests reuse kept-alive
+# connections instead of opening new TLS sessions.
+CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    max_pool_connections=64,
+    tcp_keepalive=True,
+)
+
+# Polling schedule per waiter, replacing the botocore defaults (up to 30s between polls) so that
+# quick deletions are noticed within seconds while slow ones still have enough attempts
+WAITER_CONFIGS = {
+    'instance_terminated': {'Delay': 5, 'MaxAttempts': 120},
+    'services_inactive': {'Delay': 5, 'MaxAttempts': 120},
+    'tasks_stopped': {'Delay': 5, 'MaxAttempts': 120},
+    'nodegroup_deleted': {'Delay': 15, 'MaxAttempts': 80},
+    'cluster_deleted': {'Delay': 15, 'MaxAttempts': 80},
+}
+
+
+# A single session shares credentials, endpoint data and loader caches between all clients
+SESSION = boto3.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _client(service_name, region):
+    """
+    Returns the client for service_name in region, creating it on first use.
+
+    Clients are created from the module-level session and reused by every function, so
+    their setup cost and connection pool are paid once per service and region.
+    """
+    return SESSION.client(service_name, region_name=region, config=CLIENT_CONFIG)
+
+
+def _run_concurrently(fn, items, max_workers=MAX_WORKERS):
+    """
+    Calls fn on every item using a bounded thread pool and returns the results in order.
+
+    Exceptions raised by fn are propagated to the caller.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fn, items))
+
+
+def _run_pipeline(items, delete_fn, wait_fn=None, deleters=MAX_WORKERS, waiters=PIPELINE_WAITERS):
+    """
+    Runs listing, deletion and waiting as concurrent stages connected by queues.
+
+    A lister thread consumes items, which may be a lazy generator driven by a paginator, and
+    hands each item to a pool of deleter threads calling delete_fn. If wait_fn is given, each
+    deleted item is then handed to a pool of waiter threads calling wait_fn, so that waiting for
+    early deletions overlaps with listing and deleting the remaining items.
+
+    Exceptions raised by any stage are propagated to the caller once all stages have finished.
+    """
+    to_delete = queue.Queue()
+    to_wait = queue.Queue()
+    if wait_fn is None:
+        waiters = 0
+    
+    def list_items():
+        try:
+            for item in items:
+                to_delete.put(item)
+        finally:
+            # One sentinel per deleter ends the deletion stage
+            for _ in range(deleters):
+                to_delete.put(None)
+    
+    def delete_items():
+        while (item := to_delete.get()) is not None:
+            delete_fn(item)
+            if wait_fn is not None:
+                to_wait.put(item)
+    
+    def wait_items():
+        while (item := to_wait.get()) is not None:
+            wait_fn(item)
+    
+    with ThreadPoolExecutor(max_workers=1 + deleters + waiters) as executor:
+        lister = executor.submit(list_items)
+        deleter_futures = [executor.submit(delete_items) for _ in range(deleters)]
+        waiter_futures = [executor.submit(wait_items) for _ in range(waiters)]
+        
+        # Once every deleter has stopped, nothing else can be queued for the waiters
+        futures.wait(deleter_futures)
+        for _ in range(waiters):
+            to_wait.put(None)
+        
+        for future in [lister, *deleter_futures, *waiter_futures]:
+            future.result()
+
+
+def _batches(items, size):
+    """
+    Splits items into consecutive lists of at most size elements.
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+@dataclass(frozen=True)
+class ResourceSpec:
+    """
+    Declarative description of a resource type that is listed with one API operation and
+    deleted one by one with another.
+
+    Specs only cover fire-and-forget resource types, whose deletion needs no waiter and no
+    cleanup of nested resources. Types that do, such as stacks, ECS and EKS clusters, keep
+    their own delete_all_* functions.
+
+    Attributes:
+    - label (str): Human readable name of the resource type, used for logging.
+    - service (str): The boto3 service name of the client.
+    - list_op (str): The client operation listing the resources.
+    - result_key (str): The key of the list operation response holding the resources.
+    - delete_op (str): The client operation deleting a single resource.
+    - delete_kw (str): The keyword argument of delete_op receiving the resource identifier.
+    - id_field (str): The field holding the identifier of each listed resource, or None if the
+      list operation returns the identifiers themselves.
+    - delete_args (tuple): Additional keyword arguments passed to delete_op, as (name, value)
+      pairs so that specs stay immutable and hashable.
+    - paginate (bool): Whether list_op has a paginator.
+    - log_deleted (bool): Whether delete_op completes the deletion, so that the resource can be
+      logged as deleted once it returns.
+    """
+    label: str
+    service: str
+    list_op: str
+    result_key: str
+    delete_op: str
+    delete_kw: str
+    id_field: Optional[str] = None
+    delete_args: Tuple[Tuple[str, Any], ...] = ()
+    paginate: bool = True
+    log_deleted: bool = False
+
+
+AUTO_SCALING_GROUPS = ResourceSpec(
+    'Auto Scaling group', 'autoscaling', 'describe_auto_scaling_groups', 'AutoScalingGroups',
+    'delete_auto_scaling_group', 'AutoScalingGroupName',
+    id_field='AutoScalingGroupName', delete_args=(('ForceDelete', True),), log_deleted=True,
+)
+KINESIS_DATA_STREAMS = ResourceSpec(
+    'Kinesis data stream', 'kinesis', 'list_streams', 'StreamNames',
+    'delete_stream', 'StreamName',
+    delete_args=(('EnforceConsumerDeletion', True),),
+)
+FIREHOSE_DELIVERY_STREAMS = ResourceSpec(
+    'Kinesis Firehose delivery stream', 'firehose', 'list_delivery_streams', 'DeliveryStreamNames',
+    'delete_delivery_stream', 'DeliveryStreamName',
+    paginate=False,
+)
+
+
+def _delete_resources(spec, region):
+    """
+    Lists all resources described by spec in region and deletes them concurrently.
+
+    Parameters:
+    - spec (ResourceSpec): The resource type to delete.
+    - region (str): The AWS region where the resources are located.
+    """
+    client = _client(spec.service, region)
+    
+    if spec.paginate:
+        pages = client.get_paginator(spec.list_op).paginate()
+    else:
+        pages = [getattr(client, spec.list_op)()]
+    resource_ids = [
+        resource[spec.id_field] if spec.id_field else resource
+        for page in pages
+        for resource in page[spec.result_key]
+    ]
+    
+    delete = getattr(client, spec.delete_op)
+    
+    def delete_one(resource_id):
+        logger.info(f"Deleting {spec.label}: {resource_id} in region {region}")
+        delete(**{spec.delete_kw: resource_id}, **dict(spec.delete_args))
+        
+        if spec.log_deleted:
+            logger.info(f"Deleted {spec.label}: {resource_id} in region {region}")
+    
+    _run_concurrently(delete_one, resource_ids)
+
 
 def delete_all_stacks(region='us-east-1', wait=True):
     """
@@ -12,58 +267,92 @@ def delete_all_stacks(region='us-east-1', wait=True):
 
     Parameters:
     region (str): The AWS region to target. Defaults to 'us-east-1'.
-    wait (bool): Whether to wait for each stack to be deleted before deleting the next one. Defaults to True.
+    wait (bool): Whether to wait for the stacks to be deleted. Stacks are deleted concurrently, but
+                 'AppPipe' and 'AppIngestion' stacks are always processed before the others. Defaults to True.
 
     Returns:
     None
     """
     # Create a CloudFormation client for the specified region
-    client = boto3.client('cloudformation', region_name=region)
+    client = _client('cloudformation', region)
     
-    # Initialize a paginator to handle pagination
+    # A single unfiltered describe_stacks sweep returns the status and termination protection
+    # flag of every stack, so no per-stack describe_stacks call is needed. The stacks are
+    # partitioned while paginating: 'AppPipe' and 'AppIngestion' stacks are deleted first,
+    # including previously failed deletions, then all other stacks.
+    priority_names = []
+    other_names = []
+    paginator = client.get_paginator('describe_stacks')
+    for page in paginator.paginate():
+        for stack in page['Stacks']:
+            stack_name = stack['StackName']
+            is_priority = 'AppPipe' in stack_name or 'AppIngestion' in stack_name
+            statuses = PRIORITY_STACK_STATUSES if is_priority else STACK_STATUSES
+            if stack['StackStatus'] not in statuses:
+                continue
+            
+            # Skip stacks that have termination protection enabled
+            if stack.get('EnableTerminationProtection'):
+                logger.info(f"Skipping stack: {stack_name} in region {region} due to termination protection")
+                continue
+            
+            (priority_names if is_priority else other_names).append(stack_name)
+    
+    def delete_one(stack_name):
+        logger.info(f"Deleting stack: {stack_name} in region {region}")
+        client.delete_stack(StackName=stack_name)
+    
+    for stack_names in (priority_names, other_names):
+        _run_concurrently(delete_one, stack_names)
+        if wait:
+            # Optionally, wait for the stacks to be deleted
+            _wait_for_stacks_deleted(client, stack_names, region)
+
+
+def _wait_for_stacks_deleted(client, stack_names, region):
+    """
+    Waits until none of the given CloudFormation stacks is being deleted any more.
+
+    Instead of running a waiter per stack, which polls describe_stacks for each of them, this
+    lists all stacks in DELETE_IN_PROGRESS or DELETE_FAILED every STACK_DRAIN_INTERVAL seconds
+    until none of stack_names is left or STACK_DELETE_TIMEOUT seconds have passed.
+
+    Parameters:
+    - client: The CloudFormation client to use.
+    - stack_names (list): The names of the stacks whose deletion was started.
+    - region (str): The AWS region of the stacks, used for logging.
+
+    Raises:
+    RuntimeError: If the deletion of any of the stacks failed or did not finish within
+    STACK_DELETE_TIMEOUT seconds.
+    """
+    pending = set(stack_names)
+    failed = set()
+    deadline = time.monotonic() + STACK_DELETE_TIMEOUT
     paginator = client.get_paginator('list_stacks')
-    page_iterator = paginator.paginate(StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE', 'ROLLBACK_COMPLETE', 'DELETE_FAILED'])
+    while pending and time.monotonic() < deadline:
+        time.sleep(STACK_DRAIN_INTERVAL)
+        in_progress = set()
+        for page in paginator.paginate(StackStatusFilter=['DELETE_IN_PROGRESS', 'DELETE_FAILED']):
+            for stack in page['StackSummaries']:
+                if stack['StackStatus'] == 'DELETE_FAILED':
+                    if stack['StackName'] in pending:
+                        logger.warning(f"Failed to delete stack: {stack['StackName']} in region {region}")
+                        failed.add(stack['StackName'])
+                else:
+                    in_progress.add(stack['StackName'])
+        pending -= failed
+        for stack_name in sorted(pending - in_progress):
+            logger.info(f"Deleted stack: {stack_name} in region {region}")
+        pending &= in_progress
     
-    # First, delete stacks containing 'AppPipe' in their name
-    for page in page_iterator:
-        for stack in page['StackSummaries']:
-            stack_name = stack['StackName']
-            if 'AppPipe' in stack_name or 'AppIngestion' in stack_name:
-                # Check if the stack has termination protection enabled
-                stack_details = client.describe_stacks(StackName=stack_name)
-                if stack_details['Stacks'][0]['EnableTerminationProtection']:
-                    print(f"Skipping stack: {stack_name} in region {region} due to termination protection")
-                    continue
-                
-                print(f"Deleting stack: {stack_name} in region {region}")
-                client.delete_stack(StackName=stack_name)
-                if wait:
-                    # Optionally, wait for the stack to be deleted
-                    waiter = client.get_waiter('stack_delete_complete')
-                    waiter.wait(StackName=stack_name)
-                    print(f"Deleted stack: {stack_name} in region {region}")
-    
-    # Reinitialize the paginator to handle pagination again
-    page_iterator = paginator.paginate(StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE', 'ROLLBACK_COMPLETE'])
-    
-    # Then, delete all other stacks
-    for page in page_iterator:
-        for stack in page['StackSummaries']:
-            stack_name = stack['StackName']
-            if 'AppPipe' not in stack_name:
-                # Check if the stack has termination protection enabled
-                stack_details = client.describe_stacks(StackName=stack_name)
-                if stack_details['Stacks'][0]['EnableTerminationProtection']:
-                    print(f"Skipping stack: {stack_name} in region {region} due to termination protection")
-                    continue
-                
-                print(f"Deleting stack: {stack_name} in region {region}")
-                client.delete_stack(StackName=stack_name)
-                if wait:
-                    # Optionally, wait for the stack to be deleted
-                    waiter = client.get_waiter('stack_delete_complete')
-                    waiter.wait(StackName=stack_name)
-                    print(f"Deleted stack: {stack_name} in region {region}")
+    for stack_name in sorted(pending):
+        logger.warning(f"Stack still being deleted after timeout: {stack_name} in region {region}")
+    
+    if failed:
+        raise RuntimeError(f"Failed to delete stacks in region {region}: {', '.join(sorted(failed))}")
+    if pending:
+        raise RuntimeError(f"Timed out waiting for stacks to be deleted in region {region}: {', '.join(sorted(pending))}")
 
 
 def delete_all_auto_scaling_groups(region='us-east-1'):
@@ -79,30 +368,15 @@ def delete_all_auto_scaling_groups(region='us-east-1'):
     - Ensure that you have the necessary AWS permissions to delete Auto Scaling groups.
     - This operation is destructive and cannot be undone. Use with caution.
     """
-    # Create an Auto Scaling client for the specified region
-    client = boto3.client('autoscaling', region_name=region)
-    
-    # List all Auto Scaling groups in the specified region
-    paginator = client.get_paginator('describe_auto_scaling_groups')
-    page_iterator = paginator.paginate()
-    
-    for page in page_iterator:
-        for asg in page['AutoScalingGroups']:
-            asg_name = asg['AutoScalingGroupName']
-            
-            print(f"Deleting Auto Scaling group: {asg_name} in region {region}")
-            client.delete_auto_scaling_group(AutoScalingGroupName=asg_name, ForceDelete=True)
-            
-            print(f"Deleted Auto Scaling group: {asg_name} in region {region}")
+    _delete_resources(AUTO_SCALING_GROUPS, region)
 
 
 def delete_all_lambda_functions(region='us-east-1'):
     """
     Deletes all AWS Lambda functions in the specified AWS region.
 
-    This function lists all Lambda functions in the given region and deletes each one.
-    It uses a custom polling mechanism to ensure that each Lambda function is fully deleted before
-    proceeding to the next one.
+    This function lists all Lambda functions in the given region and deletes them concurrently.
+    A final listing pass verifies that the functions are gone before the function returns.
 
     Parameters:
     - region (str): The AWS region where the Lambda functions are located. Default is 'us-east-1'.
@@ -112,59 +386,108 @@ def delete_all_lambda_functions(region='us-east-1'):
     - This operation is destructive and cannot be undone. Use with caution.
     """
     # Create a Lambda client for the specified region
-    client = boto3.client('lambda', region_name=region)
+    client = _client('lambda', region)
     
     # List all Lambda functions in the specified region
     paginator = client.get_paginator('list_functions')
     page_iterator = paginator.paginate()
     
-    for page in page_iterator:
-        for function in page['Functions']:
-            function_name = function['FunctionName']
-            
-            print(f"Deleting Lambda function: {function_name} in region {region}")
-            client.delete_function(FunctionName=function_name)
-            
-            # Custom polling mechanism to check if the function is deleted
-            while True:
-                try:
-                    client.get_function(FunctionName=function_name)
-                except client.exceptions.ResourceNotFoundException:
-                    print(f"Deleted Lambda function: {function_name} in region {region}")
-                    break
-                except Exception as e:
-                    print(f"Error checking function status: {e}")
-                    break
-                time.sleep(5)  # Wait for 5 seconds before checking again
+    function_names = [function['FunctionName'] for page in page_iterator for function in page['Functions']]
+    
+    def delete_one(function_name):
+        logger.info(f"Deleting Lambda function: {function_name} in region {region}")
+        client.delete_function(FunctionName=function_name)
+    
+    _run_concurrently(delete_one, function_names, max_workers=LAMBDA_MAX_WORKERS)
+    
+    # DeleteFunction takes effect almost immediately, so instead of polling each function, verify
+    # the deletion with a single listing pass, backing off exponentially between attempts
+    remaining = set(function_names)
+    delay = 0.1
+    deadline = time.monotonic() + LAMBDA_VERIFY_TIMEOUT
+    while remaining:
+        listed = {function['FunctionName'] for page in paginator.paginate() for function in page['Functions']}
+        for function_name in sorted(remaining - listed):
+            logger.info(f"Deleted Lambda function: {function_name} in region {region}")
+        remaining &= listed
+        if not remaining or time.monotonic() >= deadline:
+            break
+        time.sleep(delay)
+        delay = min(5, delay * 2)
+    
+    for function_name in sorted(remaining):
+        logger.warning(f"Lambda function still present after deletion: {function_name} in region {region}")
 
 
-def delete_all_opensearch_clusters(region='us-east-1'):
+def delete_all_opensearch_clusters(region='us-east-1', wait=True):
     """
     Deletes all Amazon OpenSearch clusters in the specified AWS region.
 
-    This function lists all OpenSearch clusters in the given region and deletes each one.
-    It uses AWS waiters to ensure that each OpenSearch cluster is fully deleted before
-    proceeding to the next one.
+    This function lists all OpenSearch clusters in the given region and deletes them concurrently.
+    If wait is True, it then polls the domain list until none of the clusters is listed any more,
+    so that the network interfaces and security groups they hold are released before dependent
+    CloudFormation stacks are deleted.
 
     Parameters:
     - region (str): The AWS region where the OpenSearch clusters are located. Default is 'us-west-2'.
+    - wait (bool): If True, the function will wait for all OpenSearch clusters to be fully
+      deleted before returning. Default is True.
 
     Note:
     - Ensure that you have the necessary AWS permissions to delete OpenSearch clusters.
     - This operation is destructive and cannot be undone. Use with caution.
     """
     # Create an OpenSearch client for the specified region
-    client = boto3.client('opensearch', region_name=region)
+    client = _client('opensearch', region)
     
     # List all OpenSearch clusters in the specified region
     clusters = client.list_domain_names()['DomainNames']
     
-    for cluster in clusters:
-        domain_name = cluster['DomainName']
-        
-        print(f"Deleting OpenSearch cluster: {domain_name} in region {region}")
+    domain_names = [cluster['DomainName'] for cluster in clusters]
+    
+    def delete_one(domain_name):
+        logger.info(f"Deleting OpenSearch cluster: {domain_name} in region {region}")
         client.delete_domain(DomainName=domain_name)
-        print(f"Deleted OpenSearch cluster: {domain_name} in region {region}")
+    
+    _run_concurrently(delete_one, domain_names)
+    
+    if wait:
+        _wait_for_domains_deleted(client, domain_names, region)
+
+
+def wait_for_opensearch_clusters_deleted(region='us-east-1'):
+    """
+    Waits until all Amazon OpenSearch clusters in the specified AWS region are fully deleted.
+
+    This allows the deletions to be started early with delete_all_opensearch_clusters(wait=False)
+    and awaited only right before the CloudFormation stacks that depend on them are deleted.
+
+    Parameters:
+    - region (str): The AWS region where the OpenSearch clusters are located. Default is 'us-east-1'.
+    """
+    client = _client('opensearch', region)
+    domain_names = [cluster['DomainName'] for cluster in client.list_domain_names()['DomainNames']]
+    _wait_for_domains_deleted(client, domain_names, region)
+
+
+def _wait_for_domains_deleted(client, domain_names, region):
+    """
+    Polls the OpenSearch domain list until none of domain_names is listed any more.
+
+    Domains stay listed while they are being deleted. The list is checked every
+    OPENSEARCH_DRAIN_INTERVAL seconds for at most OPENSEARCH_DELETE_TIMEOUT seconds.
+    """
+    pending = set(domain_names)
+    deadline = time.monotonic() + OPENSEARCH_DELETE_TIMEOUT
+    while pending and time.monotonic() < deadline:
+        time.sleep(OPENSEARCH_DRAIN_INTERVAL)
+        listed = {cluster['DomainName'] for cluster in client.list_domain_names()['DomainNames']}
+        for domain_name in sorted(pending - listed):
+            logger.info(f"Deleted OpenSearch cluster: {domain_name} in region {region}")
+        pending &= listed
+    
+    for domain_name in sorted(pending):
+        logger.warning(f"OpenSearch cluster still being deleted after timeout: {domain_name} in region {region}")
 
 
 def delete_all_eks_clusters(region='us-east-1', wait=False):
@@ -172,7 +495,8 @@ def delete_all_eks_clusters(region='us-east-1', wait=False):
     Deletes all Amazon EKS clusters in the specified AWS region.
 
     This function lists all EKS clusters in the given region, deletes all node groups
-    associated with each cluster, and then deletes the clusters themselves. It uses
+    associated with each cluster, and then deletes the clusters themselves. Clusters are
+    processed concurrently, and the node groups of a cluster are deleted in parallel. It uses
     AWS waiters to ensure that node groups and clusters are fully deleted before
     proceeding to the next step.
 
@@ -186,115 +510,139 @@ def delete_all_eks_clusters(region='us-east-1', wait=False):
     - This operation is destructive and cannot be undone. Use with caution.
     """
     # Create an EKS client for the specified region
-    client = boto3.client('eks', region_name=region)
+    client = _client('eks', region)
     
     # List all EKS clusters in the specified region
     clusters = client.list_clusters()['clusters']
     
-    for cluster_name in clusters:
+    def delete_one(cluster_name):
         # List all node groups for the current cluster
         node_groups = client.list_nodegroups(clusterName=cluster_name)['nodegroups']
         
-        # Iterate over each node group and delete it
+        # Start deleting every node group at once
         for node_group in node_groups:
-            print(f"Deleting node group: {node_group} in cluster: {cluster_name}")
+            logger.info(f"Deleting node group: {node_group} in cluster: {cluster_name}")
             client.delete_nodegroup(clusterName=cluster_name, nodegroupName=node_group)
-            
-            # Wait for the node group to be fully deleted
+        
+        # Wait for all node groups to be fully deleted in parallel
+        def wait_node_group(node_group):
             waiter = client.get_waiter('nodegroup_deleted')
-            waiter.wait(clusterName=cluster_name, nodegroupName=node_group)
+            waiter.wait(clusterName=cluster_name, nodegroupName=node_group, WaiterConfig=WAITER_CONFIGS['nodegroup_deleted'])
+        
+        _run_concurrently(wait_node_group, node_groups)
         
         # After all node groups are deleted, delete the cluster
-        print(f"Deleting EKS cluster: {cluster_name} in region {region}")
+        logger.info(f"Deleting EKS cluster: {cluster_name} in region {region}")
         client.delete_cluster(name=cluster_name)
         
         # Optionally wait for the cluster to be fully deleted
         if wait:
             waiter = client.get_waiter('cluster_deleted')
-            waiter.wait(name=cluster_name)
+            waiter.wait(name=cluster_name, WaiterConfig=WAITER_CONFIGS['cluster_deleted'])
+    
+    # Each cluster worker runs its own pool of node group waiters, so the number of clusters
+    # handled at once is capped to keep all threads within the client's connection pool
+    _run_concurrently(delete_one, clusters, max_workers=EKS_MAX_CLUSTERS)
 
 
 def delete_all_peering_connections(region='us-east-1'):
     """
     List all VPC peering connections, delete them, and if there are routes associated with the peering connections, delete them.
     """
-    client = boto3.client('ec2', region_name=region)
+    client = _client('ec2', region)
     response = client.describe_vpc_peering_connections()
     
+    # Index the routes of every route table by peering connection once, instead of
+    # describing the route tables again for each peering connection
+    peering_routes = defaultdict(list)
+    route_table_paginator = client.get_paginator('describe_route_tables')
+    for page in route_table_paginator.paginate(Filters=[{'Name': 'route.vpc-peering-connection-id', 'Values': ['*']}]):
+        for route_table in page['RouteTables']:
+            for route in route_table['Routes']:
+                if route.get('VpcPeeringConnectionId') and 'DestinationCidrBlock' in route:
+                    peering_routes[route['VpcPeeringConnectionId']].append((route_table['RouteTableId'], route['DestinationCidrBlock']))
+    
     for peering_connection in response['VpcPeeringConnections']:
         peering_connection_id = peering_connection['VpcPeeringConnectionId']
-        print(f"Deleting VPC peering connection: {peering_connection_id} in region {region}")
+        logger.info(f"Deleting VPC peering connection: {peering_connection_id} in region {region}")
         
         # Delete routes associated with the peering connection
-        routes = client.describe_route_tables(Filters=[{'Name': 'route.vpc-peering-connection-id', 'Values': [peering_connection_id]}])
-        for route_table in routes['RouteTables']:
-            for route in route_table['Routes']:
-                if route.get('VpcPeeringConnectionId') == peering_connection_id:
-                    client.delete_route(RouteTableId=route_table['RouteTableId'], DestinationCidrBlock=route['DestinationCidrBlock'])
-                    print(f"Deleted route: {route['DestinationCidrBlock']} in route table: {route_table['RouteTableId']}")
+        def delete_route(route):
+            route_table_id, destination_cidr_block = route
+            client.delete_route(RouteTableId=route_table_id, DestinationCidrBlock=destination_cidr_block)
+            logger.info(f"Deleted route: {destination_cidr_block} in route table: {route_table_id}")
+        
+        _run_concurrently(delete_route, peering_routes[peering_connection_id])
         
         # Delete the peering connection
         client.delete_vpc_peering_connection(VpcPeeringConnectionId=peering_connection_id)
-        print(f"Deleted VPC peering connection: {peering_connection_id} in region {region}")
+        logger.info(f"Deleted VPC peering connection: {peering_connection_id} in region {region}")
 
 
 def delete_all_kinesis_streams(region='us-east-1'):
     """
     List all Kinesis data streams and Firehose delivery streams, and delete them.
     """
-    kinesis_client = boto3.client('kinesis', region_name=region)
-    firehose_client = boto3.client('firehose', region_name=region)
-    
     # Delete Kinesis data streams
-    data_streams = kinesis_client.list_streams()['StreamNames']
-    for stream_name in data_streams:
-        print(f"Deleting Kinesis data stream: {stream_name} in region {region}")
-        kinesis_client.delete_stream(StreamName=stream_name, EnforceConsumerDeletion=True)
+    _delete_resources(KINESIS_DATA_STREAMS, region)
     
     # Delete Kinesis Firehose delivery streams
-    firehose_streams = firehose_client.list_delivery_streams()['DeliveryStreamNames']
-    for stream_name in firehose_streams:
-        print(f"Deleting Kinesis Firehose delivery stream: {stream_name} in region {region}")
-        firehose_client.delete_delivery_stream(DeliveryStreamName=stream_name)
+    _delete_resources(FIREHOSE_DELIVERY_STREAMS, region)
 
 
 def terminate_all_ec2_instances(region='us-east-1', wait=True):
     """
     Terminates all EC2 instances in the specified AWS region.
 
-    This function lists all EC2 instances in the given region and terminates each one.
-    It uses AWS waiters to ensure that each EC2 instance is fully terminated before
-    proceeding to the next one if wait is True.
+    This function lists all EC2 instances in the given region and terminates them in batches
+    of up to EC2_BATCH_SIZE instances per API call, starting with the first page of instances
+    while later pages are still being listed. It uses AWS waiters to ensure that each
+    EC2 instance is fully terminated before returning if wait is True.
 
     Parameters:
     - region (str): The AWS region where the EC2 instances are located. Default is 'us-east-1'.
-    - wait (bool): If True, the function will wait for each EC2 instance to be fully
-      terminated before proceeding. Default is True.
+    - wait (bool): If True, the function will wait for every EC2 instance to be fully
+      terminated before returning. Default is True.
 
     Note:
     - Ensure that you have the necessary AWS permissions to terminate EC2 instances.
     - This operation is destructive and cannot be undone. Use with caution.
     """
     # Create an EC2 client for the specified region
-    client = boto3.client('ec2', region_name=region)
+    client = _client('ec2', region)
     
     # List all EC2 instances in the specified region
     paginator = client.get_paginator('describe_instances')
-    page_iterator = paginator.paginate()
+    # Instances that are already terminated or shutting down need no further action,
+    # so they are filtered out on the server side. Pages are capped at EC2_BATCH_SIZE instances
+    # so that each page can be terminated while the next one is still being fetched.
+    page_iterator = paginator.paginate(
+        Filters=[{'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}],
+        PaginationConfig={'PageSize': EC2_BATCH_SIZE},
+    )
     
-    for page in page_iterator:
-        for reservation in page['Reservations']:
-            for instance in reservation['Instances']:
-                instance_id = instance['InstanceId']
-                
-                print(f"Terminating EC2 instance: {instance_id} in region {region}")
-                client.terminate_instances(InstanceIds=[instance_id])
-                
-                if wait:
-                    # Optionally, wait for the EC2 instance to be fully terminated
-                    waiter = client.get_waiter('instance_terminated')
-                    waiter.wait(InstanceIds=[instance_id])
-                    print(f"Terminated EC2 instance: {instance_id} in region {region}")
+    def list_batches():
+        # TerminateInstances accepts many instance IDs per call, so terminate them in batches
+        for page in page_iterator:
+            instance_ids = [
+                instance['InstanceId']
+                for reservation in page['Reservations']
+                for instance in reservation['Instances']
+            ]
+            yield from _batches(instance_ids, EC2_BATCH_SIZE)
+    
+    def terminate_batch(batch):
+        logger.info(f"Terminating EC2 instances: {', '.join(batch)} in region {region}")
+        client.terminate_instances(InstanceIds=batch)
+    
+    def wait_batch(batch):
+        # Optionally, wait for the EC2 instances to be fully terminated
+        waiter = client.get_waiter('instance_terminated')
+        waiter.wait(InstanceIds=batch, WaiterConfig=WAITER_CONFIGS['instance_terminated'])
+        logger.info(f"Terminated EC2 instances: {', '.join(batch)} in region {region}")
+    
+    _run_pipeline(list_batches(), terminate_batch, wait_batch if wait else None)
+
 
 def delete_all_ecs_clusters(region='us-east-1', wait=True):
     """
@@ -302,18 +650,20 @@ def delete_all_ecs_clusters(region='us-east-1', wait=True):
 
     This function lists all ECS clusters in the given region and deletes each one.
     Before deleting a cluster, it ensures that all tasks and services within the cluster are deleted.
-    It uses AWS waiters to ensure that each ECS cluster is fully deleted before proceeding to the next one if wait is True.
+    Services and tasks within a cluster are handled concurrently, and AWS waiters ensure that they are
+    fully deleted and stopped before the cluster itself is deleted if wait is True.
 
     Parameters:
     - region (str): The AWS region where the ECS clusters are located. Default is 'us-east-1'.
-    - wait (bool): If True, the function will wait for each ECS cluster to be fully deleted before proceeding. Default is True.
+    - wait (bool): If True, the function will wait for the services and tasks of each ECS cluster to be fully
+      deleted and stopped before deleting the cluster. Default is True.
 
     Note:
     - Ensure that you have the necessary AWS permissions to delete ECS clusters, services, and tasks.
     - This operation is destructive and cannot be undone. Use with caution.
     """
     # Create an ECS client for the specified region
-    client = boto3.client('ecs', region_name=region)
+    client = _client('ecs', region)
     
     # List all ECS clusters in the specified region
     paginator = client.get_paginator('list_clusters')
@@ -321,57 +671,148 @@ def delete_all_ecs_clusters(region='us-east-1', wait=True):
     
     for page in page_iterator:
         for cluster_arn in page['clusterArns']:
-            # List and delete all services in the cluster
+            # List all services in the cluster, scale them down and delete them concurrently
             service_paginator = client.get_paginator('list_services')
-            service_page_iterator = service_paginator.paginate(cluster=cluster_arn)
-            for service_page in service_page_iterator:
-                for service_arn in service_page['serviceArns']:
-                    print(f"Deleting service: {service_arn} in cluster: {cluster_arn} in region {region}")
-                    client.update_service(cluster=cluster_arn, service=service_arn, desiredCount=0)
-                    client.delete_service(cluster=cluster_arn, service=service_arn, force=True)
-                    if wait:
-                        waiter = client.get_waiter('services_inactive')
-                        waiter.wait(cluster=cluster_arn, services=[service_arn])
-                        print(f"Deleted service: {service_arn} in cluster: {cluster_arn} in region {region}")
+            service_arns = [
+                service_arn
+                for service_page in service_paginator.paginate(cluster=cluster_arn)
+                for service_arn in service_page['serviceArns']
+            ]
+            
+            def scale_down_service(service_arn):
+                logger.info(f"Deleting service: {service_arn} in cluster: {cluster_arn} in region {region}")
+                client.update_service(cluster=cluster_arn, service=service_arn, desiredCount=0)
+            
+            def delete_service(service_arn):
+                client.delete_service(cluster=cluster_arn, service=service_arn, force=True)
+            
+            _run_concurrently(scale_down_service, service_arns)
+            _run_concurrently(delete_service, service_arns)
+            if wait:
+                # The services_inactive waiter accepts at most 10 services per call
+                def wait_services(batch):
+                    waiter = client.get_waiter('services_inactive')
+                    waiter.wait(cluster=cluster_arn, services=batch, WaiterConfig=WAITER_CONFIGS['services_inactive'])
+                    for service_arn in batch:
+                        logger.info(f"Deleted service: {service_arn} in cluster: {cluster_arn} in region {region}")
+                
+                _run_concurrently(wait_services, _batches(service_arns, ECS_SERVICE_BATCH_SIZE))
             
-            # List and stop all tasks in the cluster
+            # List all tasks in the cluster and stop them concurrently
             task_paginator = client.get_paginator('list_tasks')
-            task_page_iterator = task_paginator.paginate(cluster=cluster_arn)
-            for task_page in task_page_iterator:
-                for task_arn in task_page['taskArns']:
-                    print(f"Stopping task: {task_arn} in cluster: {cluster_arn} in region {region}")
-                    client.stop_task(cluster=cluster_arn, task=task_arn)
-                    if wait:
-                        waiter = client.get_waiter('tasks_stopped')
-                        waiter.wait(cluster=cluster_arn, tasks=[task_arn])
-                        print(f"Stopped task: {task_arn} in cluster: {cluster_arn} in region {region}")
+            task_arns = [
+                task_arn
+                for task_page in task_paginator.paginate(cluster=cluster_arn)
+                for task_arn in task_page['taskArns']
+            ]
             
-            # Delete the ECS cluster
-            print(f"Deleting ECS cluster: {cluster_arn} in region {region}")
-            client.delete_cluster(cluster=cluster_arn)
+            def stop_task(task_arn):
+                logger.info(f"Stopping task: {task_arn} in cluster: {cluster_arn} in region {region}")
+                client.stop_task(cluster=cluster_arn, task=task_arn)
+            
+            _run_concurrently(stop_task, task_arns)
             if wait:
-                waiter = client.get_waiter('cluster_deleted')
-                waiter.wait(clusters=[cluster_arn])
-                print(f"Deleted ECS cluster: {cluster_arn} in region {region}")
+                # The tasks_stopped waiter accepts at most 100 tasks per call
+                def wait_tasks(batch):
+                    waiter = client.get_waiter('tasks_stopped')
+                    waiter.wait(cluster=cluster_arn, tasks=batch, WaiterConfig=WAITER_CONFIGS['tasks_stopped'])
+                    for task_arn in batch:
+                        logger.info(f"Stopped task: {task_arn} in cluster: {cluster_arn} in region {region}")
+                
+                _run_concurrently(wait_tasks, _batches(task_arns, ECS_TASK_BATCH_SIZE))
+            
+            # Delete the ECS cluster. ECS has no cluster waiter; DeleteCluster returns once the
+            # cluster is INACTIVE.
+            logger.info(f"Deleting ECS cluster: {cluster_arn} in region {region}")
+            client.delete_cluster(cluster=cluster_arn)
+            logger.info(f"Deleted ECS cluster: {cluster_arn} in region {region}")
 
 
+def _configure_worker_logging(log_queue):
+    """
+    Routes all log records of a worker process to log_queue.
 
-# Example usage
-if __name__ == "__main__":
+    Worker threads only enqueue records, and a single listener thread in the parent process
+    writes them out, so they never contend for stdout.
+    """
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+
+# Steps of purge_region with their keyword arguments and the steps that must finish first.
+# Instances must not be replaced by their Auto Scaling groups while they are terminated, the
+# OpenSearch deletions are started early and only awaited before the stacks, and the
+# CloudFormation stacks are deleted once every resource that may block them is gone.
+PURGE_STEPS = {
+    delete_all_auto_scaling_groups: ({}, ()),
+    delete_all_ecs_clusters: ({'wait': True}, (delete_all_auto_scaling_groups,)),
+    terminate_all_ec2_instances: ({'wait': False}, (delete_all_auto_scaling_groups, delete_all_ecs_clusters)),
+    delete_all_lambda_functions: ({}, ()),
+    delete_all_peering_connections: ({}, ()),
+    delete_all_opensearch_clusters: ({'wait': False}, ()),
+    delete_all_kinesis_streams: ({}, ()),
+    delete_all_eks_clusters: ({}, ()),
+    # Awaited after every other step, so the domains are torn down while the rest is deleted
+    wait_for_opensearch_clusters_deleted: ({}, (
+        delete_all_auto_scaling_groups,
+        delete_all_ecs_clusters,
+        terminate_all_ec2_instances,
+        delete_all_lambda_functions,
+        delete_all_peering_connections,
+        delete_all_opensearch_clusters,
+        delete_all_kinesis_streams,
+        delete_all_eks_clusters,
+    )),
+    delete_all_stacks: ({'wait': False}, (
+        terminate_all_ec2_instances,
+        delete_all_ecs_clusters,
+        delete_all_lambda_functions,
+        delete_all_peering_connections,
+        delete_all_kinesis_streams,
+        delete_all_eks_clusters,
+        wait_for_opensearch_clusters_deleted,
+    )),
+}
+
+# Order in which purge_region runs the steps, computed once from their dependencies
+PURGE_PLAN = tuple(
+    (step, PURGE_STEPS[step][0])
+    for step in TopologicalSorter({step: dependencies for step, (_, dependencies) in PURGE_STEPS.items()}).static_order()
+)
+
+
+def purge_region(region):
+    """
+    Deletes all supported resources in a single AWS region, following PURGE_PLAN.
 
-    # Change the region to the one you want to delete
-    region = 'cn-north-1'
+    Parameters:
+    - region (str): The AWS region to purge.
+    """
+    for step, kwargs in PURGE_PLAN:
+        step(region, **kwargs)
 
-    delete_all_auto_scaling_groups(region)
-    delete_all_ecs_clusters(region, wait=True)
-    terminate_all_ec2_instances(region, wait=False)
-    delete_all_lambda_functions(region)
-    delete_all_peering_connections(region)
-    delete_all_opensearch_clusters(region)
-    delete_all_kinesis_streams(region)
-    delete_all_eks_clusters(region)
 
-    # after all blocking resources are deleted, delete the cloudformation stacks
-    delete_all_stacks(region, wait=False)
+# Example usage
+if __name__ == "__main__":
 
-    
+    # Change the regions to the ones you want to delete
+    regions = ['cn-north-1']
+
+    # Log records from all processes are written by a single listener thread
+    log_queue = multiprocessing.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+
+    # Each region is purged in its own process with its own clients and connection pools
+    try:
+        with multiprocessing.Pool(processes=min(8, len(regions)), initializer=_configure_worker_logging, initargs=(log_queue,)) as pool:
+            pool.map(purge_region, regions)
+            # Let the workers exit normally so their queued log records are flushed; leaving the
+            # with block alone would terminate them
+            pool.close()
+            pool.join()
+    finally:
+        listener.stop()